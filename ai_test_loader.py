@@ -2,13 +2,123 @@
 Test loader module for AI agent prompt tests.
 Currently uses Claude Code CLI as the default agent, but designed to be agent-agnostic.
 """
+import os
+import re
 import json
+import time
+import queue
+import hashlib
+import functools
+import threading
 import yaml
-import jsonschema
 import subprocess
-from typing import Dict, Any, List, Tuple
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Dict, Any, List, Tuple, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Schema validator backends, fastest first
+_validation_errors = []
+
+try:
+    import jsonschema_rs
+    _validation_errors.append(jsonschema_rs.ValidationError)
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema
+    _validation_errors.append(fastjsonschema.JsonSchemaValueException)
+except ImportError:
+    fastjsonschema = None
+
+if not _validation_errors:
+    # Fall back to the reference implementation when no compiled validator is available
+    import jsonschema
+    _validation_errors.append(jsonschema.ValidationError)
+
+ValidationError = tuple(_validation_errors)
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+try:
+    import diskcache
+except ImportError:
+    # Response caching is disabled when diskcache is unavailable
+    diskcache = None
+
+# Markdown code fence (```json or bare ```) wrapping a JSON response. The body
+# is stripped after matching: whitespace quantifiers around the lazy group
+# backtrack polynomially on an unclosed fence.
+_FENCE_RE = re.compile(r"^\s*```(?:json)?(.*?)```", re.DOTALL)
+
+# On-disk cache of AI agent responses, keyed by prompt and agent version
+RESPONSE_CACHE_DIR = os.path.expanduser("~/.cache/ai_test_loader")
+
+# Long-lived Claude Code CLI session that reads prompts as stream-json on stdin
+AGENT_SESSION_CMD = [
+    "claude", "--print", "--verbose",
+    "--input-format", "stream-json",
+    "--output-format", "stream-json",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_validator(schema_key: str) -> Callable[[Any], Any]:
+    """Compile the JSON schema serialized in schema_key into a validator.
+
+    Validators are cached by the canonical schema JSON, so a schema shared
+    across test runs is only compiled once.
+    """
+    schema = json.loads(schema_key)
+    if jsonschema_rs is not None:
+        return jsonschema_rs.validator_for(schema).validate
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+    return functools.partial(jsonschema.validate, schema=schema)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_agent_version() -> str:
+    """Return the AI agent CLI version, or an empty string if it is unknown."""
+    try:
+        result = subprocess.run(
+            ["claude", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+@dataclass(frozen=True, slots=True)
+class TestSpec:
+    """A single AI agent prompt test loaded from YAML."""
+    name: str
+    prompt: str
+    expected_schema: Dict[str, Any]
+    description: str = ""
+    timeout: int = 30
+    compiled_validator: Optional[Callable[[Any], Any]] = field(default=None, compare=False, repr=False)
+
+
+_TEST_SPEC_FIELDS = frozenset(f.name for f in fields(TestSpec))
 
 
 @dataclass
@@ -19,43 +129,205 @@ class TestResult:
     error_message: str = ""
     response: str = ""
     execution_time: float = 0.0
+    cached: bool = False
 
 
 class AIAgentTestLoader:
     """Loads and executes AI agent prompt tests from YAML files.
     Currently uses Claude Code CLI but designed to support multiple AI agents."""
 
-    def __init__(self, yaml_file: str):
+    def __init__(self, yaml_file: str, parallelism: Optional[int] = None,
+                 persistent_agent: bool = False, cache: bool = True):
         """Initialize the test loader.
         
         Args:
             yaml_file: Path to the YAML test file
+            parallelism: Maximum number of tests to run concurrently
+                (default: one worker per test, capped at 4x the CPU count)
+            persistent_agent: Send every prompt to one long-lived AI agent
+                process instead of spawning the CLI per test. Prompts are
+                serialized and share the session's conversation context.
+            cache: Reuse AI agent responses cached on disk for identical
+                prompts. Requires diskcache; disabled by AI_TEST_NO_CACHE=1.
         """
         self.yaml_file = yaml_file
+        self.parallelism = parallelism
+        self.persistent_agent = persistent_agent
+        self._agent_process = None
+        self._agent_output = None
+        self._agent_lock = threading.Lock()
+        self._response_cache = None
+        if cache and diskcache is not None and os.environ.get("AI_TEST_NO_CACHE") != "1":
+            self._response_cache = diskcache.Cache(RESPONSE_CACHE_DIR)
         self.tests = self._load_tests()
 
-    def _load_tests(self) -> List[Dict[str, Any]]:
-        """Load tests from YAML file."""
-        with open(self.yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
-        return data.get('tests', [])
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self._stop_agent_process()
+
+    def close(self) -> None:
+        """Terminate the persistent AI agent process and close the response cache."""
+        with self._agent_lock:
+            self._stop_agent_process()
+        if self._response_cache is not None:
+            self._response_cache.close()
+
+    def _load_tests(self) -> Tuple[TestSpec, ...]:
+        """Load tests from YAML file and precompile their response schemas."""
+        with open(self.yaml_file, 'rb') as f:
+            data = yaml.load(f, Loader=SafeLoader)
+
+        tests = []
+        for index, test_config in enumerate(data.get('tests', [])):
+            test_config = {k: v for k, v in test_config.items() if k in _TEST_SPEC_FIELDS}
+            try:
+                test_config['compiled_validator'] = _get_validator(
+                    json.dumps(test_config['expected_schema'], sort_keys=True)
+                )
+            except Exception:
+                # Leave broken schemas to fail in run_test with a proper TestResult
+                pass
+
+            try:
+                tests.append(TestSpec(**test_config))
+            except TypeError as e:
+                raise ValueError(f"Invalid test definition at index {index} in {self.yaml_file}: {e}")
+
+        return tuple(tests)
+
+    def _start_agent_process(self) -> None:
+        """Spawn the persistent AI agent process and its stdout reader thread."""
+        self._agent_process = subprocess.Popen(
+            AGENT_SESSION_CMD,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+        self._agent_output = queue.Queue()
+        threading.Thread(
+            target=self._pump_agent_output,
+            args=(self._agent_process.stdout, self._agent_output),
+            daemon=True
+        ).start()
 
-    def _call_ai_agent(self, prompt: str, timeout: int = 30) -> str:
-        """Call AI agent with the given prompt.
+    @staticmethod
+    def _pump_agent_output(stream, output: "queue.Queue[Optional[str]]") -> None:
+        """Forward agent stdout lines to a queue so reads can time out."""
+        for line in stream:
+            output.put(line)
+        output.put(None)
+
+    def _stop_agent_process(self) -> None:
+        """Terminate the persistent AI agent process. Caller holds the lock."""
+        process = getattr(self, '_agent_process', None)
+        if process is None:
+            return
+        self._agent_process = None
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def _call_persistent_agent(self, prompt: str, timeout: int) -> Dict[str, Any]:
+        """Send a prompt to the persistent AI agent and return its result event."""
+        with self._agent_lock:
+            if self._agent_process is None or self._agent_process.poll() is not None:
+                self._start_agent_process()
+
+            message = {"type": "user", "message": {"role": "user", "content": prompt}}
+            self._agent_process.stdin.write(json_dumps(message) + "\n")
+            self._agent_process.stdin.flush()
+
+            # The session streams several events per prompt; the final one is the result
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._agent_output.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    self._stop_agent_process()
+                    raise subprocess.TimeoutExpired(AGENT_SESSION_CMD, timeout)
+                if line is None:
+                    self._stop_agent_process()
+                    raise subprocess.CalledProcessError(1, AGENT_SESSION_CMD, stderr="agent session exited")
+                try:
+                    event = json_loads(line)
+                except json.JSONDecodeError:
+                    # Stray non-JSON output; keep reading so this prompt's result
+                    # is not left queued for the next one
+                    continue
+                if isinstance(event, dict) and event.get('type') == 'result':
+                    return event
+
+    @staticmethod
+    def _response_cache_key(prompt: str, schema_key: str) -> str:
+        """Return the response cache key for prompt and its expected schema
+        (canonical JSON, as passed to _get_validator) under the current agent version."""
+        key_source = f"{_get_agent_version()}\0{schema_key}\0{prompt}".encode()
+        return hashlib.blake2b(key_source).hexdigest()
+
+    def _call_ai_agent(self, prompt: str, timeout: int = 30, cache: bool = True,
+                       schema_key: str = "") -> Tuple[str, bool]:
+        """Call AI agent with the given prompt, reusing a cached response if one exists.
+
+        Returns:
+            Tuple of (response, whether it came from the cache)
+        """
+        if cache and self._response_cache is not None:
+            response = self._response_cache.get(self._response_cache_key(prompt, schema_key))
+            if response is not None:
+                return response, True
+        return self._invoke_ai_agent(prompt, timeout), False
+
+    def _cache_response(self, prompt: str, schema_key: str, response: str) -> None:
+        """Store a response that passed validation, for reuse by later runs."""
+        if self._response_cache is not None:
+            self._response_cache.set(self._response_cache_key(prompt, schema_key), response)
+
+    def _evict_response(self, prompt: str, schema_key: str) -> None:
+        """Drop a cached response that no longer passes validation."""
+        if self._response_cache is not None:
+            self._response_cache.delete(self._response_cache_key(prompt, schema_key))
+
+    def _invoke_ai_agent(self, prompt: str, timeout: int = 30) -> str:
+        """Invoke AI agent with the given prompt.
         Currently uses Claude Code CLI, but this method can be extended for other agents."""
         cmd = ["claude", "--print", "--output-format", "json", prompt]
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=True
-            )
-            
-            # Parse the JSON response from the AI agent
-            response_data = json.loads(result.stdout)
+            if self.persistent_agent:
+                response_data = self._call_persistent_agent(prompt, timeout)
+            else:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    bufsize=1 << 20
+                )
+                try:
+                    stdout, stderr = process.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise
+                if process.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        process.returncode, cmd, output=stdout,
+                        stderr=stderr.decode(errors='replace')
+                    )
+
+                # Parse the JSON response from the AI agent straight from the raw bytes
+                response_data = json_loads(stdout)
             
             # Extract the actual text content from the response
             # Claude Code CLI returns structured data, we want the result
@@ -75,73 +347,85 @@ class AIAgentTestLoader:
         except Exception as e:
             raise Exception(f"Unexpected error calling AI agent: {e}")
 
-    def _validate_json_response(self, response: str, expected_schema: Dict[str, Any]) -> Tuple[bool, str]:
+    def _validate_json_response(self, response: str, expected_schema: Dict[str, Any],
+                                validator: Optional[Callable[[Any], Any]] = None) -> Tuple[bool, str]:
         """Validate JSON response against schema.
 
+        Args:
+            response: Raw AI agent response
+            expected_schema: JSON schema the response must match
+            validator: Precompiled validator for expected_schema, if available
+
         Returns:
             Tuple of (is_valid, error_message)
         """
         try:
             # Extract JSON from markdown code block if present
-            json_content = response.strip()
-            if json_content.startswith('```json'):
-                # Find the JSON content between ```json and ```
-                start_idx = json_content.find('```json') + 7
-                end_idx = json_content.find('```', start_idx)
-                if end_idx != -1:
-                    json_content = json_content[start_idx:end_idx].strip()
-            elif json_content.startswith('```'):
-                # Handle generic code blocks
-                start_idx = json_content.find('```') + 3
-                end_idx = json_content.find('```', start_idx)
-                if end_idx != -1:
-                    json_content = json_content[start_idx:end_idx].strip()
-            
-            # Parse JSON
-            data = json.loads(json_content)
+            match = _FENCE_RE.match(response)
+            json_content = (match.group(1) if match else response).strip()
             
-            # Validate against schema
-            jsonschema.validate(data, expected_schema)
+            if validator is None:
+                validator = _get_validator(json.dumps(expected_schema, sort_keys=True))
+
+            # Parse JSON and validate against schema
+            validator(json_loads(json_content))
 
             return True, ""
         except json.JSONDecodeError as e:
             return False, f"Invalid JSON: {str(e)}"
-        except jsonschema.ValidationError as e:
+        except ValidationError as e:
             return False, f"Schema validation failed: {str(e)}"
         except Exception as e:
             return False, f"Validation error: {str(e)}"
 
-    def run_test(self, test_config: Dict[str, Any]) -> TestResult:
-        """Run a single test."""
-        start_time = datetime.now()
+    def run_test(self, test: TestSpec, cache: bool = True) -> TestResult:
+        """Run a single test.
 
-        try:
-            # Get test parameters
-            name = test_config['name']
-            prompt = test_config['prompt']
-            expected_schema = test_config['expected_schema']
-            timeout = test_config.get('timeout', 30)
+        Args:
+            test: Test definition loaded from the YAML file
+            cache: Allow a cached AI agent response to be reused
+        """
+        start_time = time.perf_counter()
 
+        try:
             # Call AI agent
-            response = self._call_ai_agent(prompt, timeout)
+            schema_key = json.dumps(test.expected_schema, sort_keys=True)
+            response, cached = self._call_ai_agent(
+                test.prompt, test.timeout, cache=cache, schema_key=schema_key
+            )
 
             # Validate response
-            is_valid, error_msg = self._validate_json_response(response, expected_schema)
+            is_valid, error_msg = self._validate_json_response(
+                response, test.expected_schema, test.compiled_validator
+            )
+
+            # A cached response that no longer validates is dropped and fetched again
+            if cached and not is_valid:
+                self._evict_response(test.prompt, schema_key)
+                response, cached = self._call_ai_agent(test.prompt, test.timeout, cache=False)
+                is_valid, error_msg = self._validate_json_response(
+                    response, test.expected_schema, test.compiled_validator
+                )
 
-            execution_time = (datetime.now() - start_time).total_seconds()
+            # Only valid responses are cached, so a flaky reply is not replayed
+            if is_valid and cache and not cached:
+                self._cache_response(test.prompt, schema_key, response)
+
+            execution_time = time.perf_counter() - start_time
 
             return TestResult(
-                name=name,
+                name=test.name,
                 passed=is_valid,
                 error_message=error_msg,
                 response=response,
-                execution_time=execution_time
+                execution_time=execution_time,
+                cached=cached
             )
 
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             return TestResult(
-                name=test_config.get('name', 'unknown'),
+                name=test.name,
                 passed=False,
                 error_message=f"Test execution failed: {str(e)}",
                 response="",
@@ -149,14 +433,13 @@ class AIAgentTestLoader:
             )
 
     def run_all_tests(self) -> List[TestResult]:
-        """Run all tests and return results."""
-        results = []
-
-        for test_config in self.tests:
-            result = self.run_test(test_config)
-            results.append(result)
+        """Run all tests concurrently and return results in test order."""
+        if not self.tests:
+            return []
 
-        return results
+        max_workers = self.parallelism or min(len(self.tests), (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.run_test, self.tests))
 
     def print_results(self, results: List[TestResult]) -> None:
         """Print test results in a readable format."""
@@ -170,7 +453,8 @@ class AIAgentTestLoader:
 
         for result in results:
             status = "PASS" if result.passed else "FAIL"
-            print(f"\n{result.name}: {status} ({result.execution_time:.2f}s)")
+            source = ", cached" if result.cached else ""
+            print(f"\n{result.name}: {status} ({result.execution_time:.2f}s{source})")
 
             if not result.passed:
                 print(f"  Error: {result.error_message}")
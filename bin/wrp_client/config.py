@@ -3,6 +3,12 @@ import os
 from pathlib import Path
 from typing import Dict, Any, List
 
+# Prefer libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Loads, validates, and processes the YAML configuration file.
@@ -12,7 +18,7 @@ def load_config(config_path: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found at: {config_path}")
 
     with open(p, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
 
     # Basic validation
     if 'LLM' not in config:
@@ -15,9 +15,29 @@ import time
 import sys
 import os
 
+# JSON-RPC messages are framed as UTF-8 bytes, so serialize straight to bytes
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+
+    def json_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
+    def json_pretty(obj):
+        return json.dumps(obj, indent=2)
+
 class CPPMCPDemo:
-    def __init__(self):
+    def __init__(self, verbose=False):
         self.server_process = None
+        self._request_counter = 0
+        self.verbose = verbose  # Print full request and response payloads
         
     def start_server(self):
         """Start the C++ MCP server as a subprocess."""
@@ -36,61 +56,78 @@ class CPPMCPDemo:
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
+            bufsize=1 << 16
         )
         
         # Give the server a moment to start
         time.sleep(1)
         
         if self.server_process.poll() is not None:
-            stderr_output = self.server_process.stderr.read()
+            stderr_output = self.server_process.stderr.read().decode(errors="replace")
             print(f"Server failed to start. Error: {stderr_output}")
             return False
             
         print("Server started successfully!")
         return True
     
-    def send_request(self, method, params=None):
-        """Send a JSON-RPC request to the server."""
-        if not hasattr(self, '_request_counter'):
-            self._request_counter = 0
-        self._request_counter += 1
-        request_id = self._request_counter  # Use simple counter as ID
+    def send_batch(self, requests):
+        """Send several JSON-RPC requests to the server as a single batch.
         
-        request = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method
-        }
-        
-        if params:
-            request["params"] = params
+        Args:
+            requests: List of (method, params) tuples
             
-        request_json = json.dumps(request) + "\n"
-        
-        print(f"Sending request: {method}")
-        print(f"   Request data: {request_json.strip()}")
+        Returns:
+            List of responses in request order, with None for missing responses
+        """
+        batch = []
+        for method, params in requests:
+            self._request_counter += 1  # Use simple counter as ID
+            request = {
+                "jsonrpc": "2.0",
+                "id": self._request_counter,
+                "method": method
+            }
+            
+            if params:
+                request["params"] = params
+                
+            batch.append(request)
+            print(f"Sending request: {method}")
+            
+        request_json = json_dumps(batch) + b"\n"
+        if self.verbose:
+            print(f"   Request data: {request_json.decode().strip()}")
         
-        # Send the request
+        # Send the whole batch in one write
         self.server_process.stdin.write(request_json)
         self.server_process.stdin.flush()
         
-        # Read the response
+        # Read the batch response
+        response_by_id = {}
         try:
             response_line = self.server_process.stdout.readline()
             if response_line:
-                response = json.loads(response_line.strip())
-                print(f"Received response:")
-                print(json.dumps(response, indent=2))
-                return response
+                responses = json_loads(response_line)
+                # A batch rejected as a whole comes back as a single error object
+                if isinstance(responses, dict):
+                    responses = [responses]
+                if self.verbose:
+                    print(f"Received response:")
+                    print(json_pretty(responses))
+                else:
+                    print(f"Received {len(responses)} response(s), {len(response_line)} bytes")
+                response_by_id = {response.get("id"): response for response in responses}
             else:
                 print("No response received")
-                return None
         except json.JSONDecodeError as e:
             print(f"Failed to parse response: {e}")
-            print(f"   Raw response: {response_line}")
-            return None
+            print(f"   Raw response: {response_line.decode(errors='replace')}")
+            
+        return [response_by_id.get(request["id"]) for request in batch]
+    
+    def send_request(self, method, params=None):
+        """Send a single JSON-RPC request to the server."""
+        return self.send_batch([(method, params)])[0]
     
     def initialize_server(self):
         """Initialize the MCP server with required handshake."""
@@ -111,7 +148,7 @@ class CPPMCPDemo:
                 "jsonrpc": "2.0",
                 "method": "notifications/initialized"
             }
-            notification_json = json.dumps(notification) + "\n"
+            notification_json = json_dumps(notification) + b"\n"
             self.server_process.stdin.write(notification_json)
             self.server_process.stdin.flush()
             
@@ -135,17 +172,47 @@ class CPPMCPDemo:
         
         print("\nTesting each tool with sample data...")
         
-        # Test statistics calculation
-        print("\n1. Testing statistics calculation...")
         sample_data = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+        matrix_a = [[1, 2], [3, 4]]
+        matrix_b = [[5, 6], [7, 8]]
+        x_values = [1.0, 2.0, 3.0, 4.0, 5.0]
+        y_values = [2.0, 4.0, 6.0, 8.0, 10.0]  # Linear: y = 2x
+        squares = [1.0, 4.0, 9.0, 16.0, 25.0]  # y = x^2, dy/dx = 2x
         
-        stats_response = self.send_request("tools/call", {
-            "name": "calculate_statistics",
-            "arguments": {
-                "data": sample_data
-            }
-        })
+        # Submit every tool call in one batch
+        stats_response, matrix_response, polyfit_response, diff_response = self.send_batch([
+            ("tools/call", {
+                "name": "calculate_statistics",
+                "arguments": {
+                    "data": sample_data
+                }
+            }),
+            ("tools/call", {
+                "name": "multiply_matrices",
+                "arguments": {
+                    "matrix_a": matrix_a,
+                    "matrix_b": matrix_b
+                }
+            }),
+            ("tools/call", {
+                "name": "polynomial_fit",
+                "arguments": {
+                    "x_values": x_values,
+                    "y_values": y_values,
+                    "degree": 1
+                }
+            }),
+            ("tools/call", {
+                "name": "numerical_differentiate",
+                "arguments": {
+                    "y_values": squares,
+                    "step_size": 1.0
+                }
+            })
+        ])
         
+        # Test statistics calculation
+        print("\n1. Testing statistics calculation...")
         if stats_response and "result" in stats_response:
             result = stats_response["result"]["structuredContent"]
             print(f"   Mean: {result.get('mean', 'N/A')}")
@@ -154,35 +221,12 @@ class CPPMCPDemo:
         
         # Test matrix multiplication
         print("\n2. Testing matrix multiplication...")
-        matrix_a = [[1, 2], [3, 4]]
-        matrix_b = [[5, 6], [7, 8]]
-        
-        matrix_response = self.send_request("tools/call", {
-            "name": "multiply_matrices",
-            "arguments": {
-                "matrix_a": matrix_a,
-                "matrix_b": matrix_b
-            }
-        })
-        
         if matrix_response and "result" in matrix_response:
             result = matrix_response["result"]["structuredContent"]
             print(f"   Result matrix: {result}")
         
         # Test polynomial fitting
         print("\n3. Testing polynomial fitting...")
-        x_values = [1.0, 2.0, 3.0, 4.0, 5.0]
-        y_values = [2.0, 4.0, 6.0, 8.0, 10.0]  # Linear: y = 2x
-        
-        polyfit_response = self.send_request("tools/call", {
-            "name": "polynomial_fit",
-            "arguments": {
-                "x_values": x_values,
-                "y_values": y_values,
-                "degree": 1
-            }
-        })
-        
         if polyfit_response and "result" in polyfit_response:
             result = polyfit_response["result"]["structuredContent"]
             print(f"   Coefficients: {result.get('coefficients', 'N/A')}")
@@ -190,16 +234,6 @@ class CPPMCPDemo:
         
         # Test numerical differentiation
         print("\n4. Testing numerical differentiation...")
-        y_values = [1.0, 4.0, 9.0, 16.0, 25.0]  # y = x^2, dy/dx = 2x
-        
-        diff_response = self.send_request("tools/call", {
-            "name": "numerical_differentiate",
-            "arguments": {
-                "y_values": y_values,
-                "step_size": 1.0
-            }
-        })
-        
         if diff_response and "result" in diff_response:
             result = diff_response["result"]["structuredContent"]
             print(f"   Derivative: {result.get('derivative', 'N/A')}")
@@ -252,6 +286,6 @@ class CPPMCPDemo:
             self.stop_server()
 
 if __name__ == "__main__":
-    demo = CPPMCPDemo()
+    demo = CPPMCPDemo(verbose="--verbose" in sys.argv[1:])
     success = demo.run_demo()
     sys.exit(0 if success else 1)
\ No newline at end of file
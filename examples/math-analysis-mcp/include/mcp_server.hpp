@@ -26,6 +26,7 @@ namespace mcp {
         bool initialized_;
         
         json::Value handle_request(const json::Value& request);
+        json::Value handle_batch(const json::Value& batch);
         json::Value handle_initialize(const json::Value& params);
         json::Value handle_tools_list();
         json::Value handle_tools_call(const json::Value& params);
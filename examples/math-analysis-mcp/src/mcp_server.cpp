@@ -21,7 +21,7 @@ namespace mcp {
             
             try {
                 json::Value request = json::parse(line);
-                json::Value response = handle_request(request);
+                json::Value response = request.is_array() ? handle_batch(request) : handle_request(request);
                 
                 if (!response.is_null()) {
                     write_line(json::stringify(response));
@@ -33,6 +33,27 @@ namespace mcp {
         }
     }
     
+    json::Value Server::handle_batch(const json::Value& batch) {
+        const auto& requests = batch.as_array();
+        if (requests.empty()) {
+            return create_error_response(-32600, "Invalid Request", json::Value());
+        }
+        
+        json::Array responses;
+        for (const auto& request : requests) {
+            json::Value response = handle_request(request);
+            if (!response.is_null()) {
+                responses.push_back(response);
+            }
+        }
+        
+        // A batch made up only of notifications gets no response
+        if (responses.empty()) {
+            return json::Value();
+        }
+        return json::Value(responses);
+    }
+    
     json::Value Server::handle_request(const json::Value& request) {
         if (!request.is_object()) {
             return create_error_response(-32600, "Invalid Request", json::Value());
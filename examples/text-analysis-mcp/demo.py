@@ -15,13 +15,32 @@ import time
 import sys
 import os
 
+# JSON-RPC messages are framed as UTF-8 bytes, so serialize straight to bytes
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+
+    def json_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
+    def json_pretty(obj):
+        return json.dumps(obj, indent=2)
+
 # Sample text for testing all tools
 SAMPLE_TEXT = "I love using Python for natural language processing! It's amazing how powerful NLTK is. However, sometimes the documentation can be confusing for beginners. Overall, I think Python is the best language for NLP tasks."
 
 class MCPDemo:
-    def __init__(self):
+    def __init__(self, verbose=False):
         self.server_process = None
         self._request_counter = 0
+        self.verbose = verbose  # Print full request and response payloads
         
     def start_server(self):
         """Start the MCP server as a subprocess."""
@@ -33,59 +52,87 @@ class MCPDemo:
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
+            bufsize=1 << 16
         )
         
         # Give the server a moment to start
         time.sleep(2)
         
         if self.server_process.poll() is not None:
-            stderr_output = self.server_process.stderr.read()
+            stderr_output = self.server_process.stderr.read().decode(errors="replace")
             print(f"Server failed to start. Error: {stderr_output}")
             return False
             
         print("Server started successfully!")
         return True
     
-    def send_request(self, method, params=None):
-        """Send a JSON-RPC request to the server."""
-        self._request_counter += 1
-        request_id = self._request_counter
-        
-        request = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method
-        }
-        
-        if params:
-            request["params"] = params
-            
-        request_json = json.dumps(request) + "\n"
+    def send_batch(self, requests):
+        """Send several JSON-RPC requests to the server in a single write.
         
-        print(f"Sending request: {method}")
-        print(f"   Request data: {request_json.strip()}")
+        The stdio transport reads one message per line, so the requests are
+        pipelined as consecutive lines rather than sent as a JSON array.
         
-        # Send the request
-        self.server_process.stdin.write(request_json)
+        Args:
+            requests: List of (method, params) tuples
+            
+        Returns:
+            List of responses in request order, with None for missing responses
+        """
+        request_lines = []
+        pending = {}
+        for method, params in requests:
+            self._request_counter += 1
+            request = {
+                "jsonrpc": "2.0",
+                "id": self._request_counter,
+                "method": method
+            }
+            
+            if params:
+                request["params"] = params
+                
+            request_json = json_dumps(request) + b"\n"
+            request_lines.append(request_json)
+            pending[request["id"]] = method
+            
+            print(f"Sending request: {method}")
+            if self.verbose:
+                print(f"   Request data: {request_json.decode().strip()}")
+        
+        # Send all requests in one write
+        self.server_process.stdin.write(b"".join(request_lines))
         self.server_process.stdin.flush()
         
-        # Read the response
-        try:
+        # Responses may arrive out of order, so match them up by id
+        request_ids = list(pending)
+        response_by_id = {}
+        while pending:
             response_line = self.server_process.stdout.readline()
-            if response_line:
-                response = json.loads(response_line.strip())
+            if not response_line:
+                print("No response received")
+                break
+            try:
+                response = json_loads(response_line)
+            except json.JSONDecodeError as e:
+                print(f"Failed to parse response: {e}")
+                print(f"   Raw response: {response_line.decode(errors='replace')}")
+                continue
+            # Skip server notifications and anything else we did not ask for
+            if not isinstance(response, dict) or response.get("id") not in pending:
+                continue
+            method = pending.pop(response["id"])
+            response_by_id[response["id"]] = response
+            if self.verbose:
                 print(f"Received response:")
-                print(json.dumps(response, indent=2))
-                return response
+                print(json_pretty(response))
             else:
-                print("No response received")
-                return None
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse response: {e}")
-            print(f"   Raw response: {response_line}")
-            return None
+                print(f"Received response: {method} (id {response['id']}, {len(response_line)} bytes)")
+            
+        return [response_by_id.get(request_id) for request_id in request_ids]
+    
+    def send_request(self, method, params=None):
+        """Send a single JSON-RPC request to the server."""
+        return self.send_batch([(method, params)])[0]
     
     def initialize_server(self):
         """Initialize the MCP server with required handshake."""
@@ -111,7 +158,7 @@ class MCPDemo:
                 "jsonrpc": "2.0",
                 "method": "notifications/initialized"
             }
-            notification_json = json.dumps(notification) + "\n"
+            notification_json = json_dumps(notification) + b"\n"
             self.server_process.stdin.write(notification_json)
             self.server_process.stdin.flush()
             
@@ -135,49 +182,50 @@ class MCPDemo:
         
         print("\nTesting each tool with sample data...")
         
+        # Submit every tool call in one write
+        sentiment_response, keywords_response, readability_response = self.send_batch([
+            ("tools/call", {
+                "name": "analyze_sentiment",
+                "arguments": {
+                    "text": SAMPLE_TEXT
+                }
+            }),
+            ("tools/call", {
+                "name": "extract_keywords",
+                "arguments": {
+                    "text": SAMPLE_TEXT,
+                    "num_keywords": 5
+                }
+            }),
+            ("tools/call", {
+                "name": "analyze_readability",
+                "arguments": {
+                    "text": SAMPLE_TEXT
+                }
+            })
+        ])
+        
         # Test sentiment analysis
         print("\n1. Testing sentiment analysis...")
-        sentiment_response = self.send_request("tools/call", {
-            "name": "analyze_sentiment",
-            "arguments": {
-                "text": SAMPLE_TEXT
-            }
-        })
-        
         if sentiment_response and "result" in sentiment_response:
             result = sentiment_response["result"]["content"][0]["text"]
-            data = json.loads(result)
+            data = json_loads(result)
             print(f"   Sentiment: {data.get('overall_sentiment', 'unknown')}")
             print(f"   Confidence: {data.get('confidence', 0):.2f}")
         
         # Test keyword extraction
         print("\n2. Testing keyword extraction...")
-        keywords_response = self.send_request("tools/call", {
-            "name": "extract_keywords",
-            "arguments": {
-                "text": SAMPLE_TEXT,
-                "num_keywords": 5
-            }
-        })
-        
         if keywords_response and "result" in keywords_response:
             result = keywords_response["result"]["content"][0]["text"]
-            data = json.loads(result)
+            data = json_loads(result)
             keywords = data.get('keywords', [])
             print(f"   Top keywords: {[kw['word'] for kw in keywords[:3]]}")
         
         # Test readability analysis
         print("\n3. Testing readability analysis...")
-        readability_response = self.send_request("tools/call", {
-            "name": "analyze_readability",
-            "arguments": {
-                "text": SAMPLE_TEXT
-            }
-        })
-        
         if readability_response and "result" in readability_response:
             result = readability_response["result"]["content"][0]["text"]
-            data = json.loads(result)
+            data = json_loads(result)
             print(f"   Reading level: {data.get('reading_level', 'unknown')}")
             print(f"   Flesch score: {data.get('readability_scores', {}).get('flesch_reading_ease', 0):.1f}")
     
@@ -228,6 +276,6 @@ class MCPDemo:
             self.stop_server()
 
 if __name__ == "__main__":
-    demo = MCPDemo()
+    demo = MCPDemo(verbose="--verbose" in sys.argv[1:])
     success = demo.run_demo()
     sys.exit(0 if success else 1)
\ No newline at end of file
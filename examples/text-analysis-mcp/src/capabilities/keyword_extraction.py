@@ -1,23 +1,20 @@
 import nltk
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
-from nltk.probability import FreqDist
-from nltk.tag import pos_tag
-from typing import Dict, Any, List
-import json
+from nltk.tag import PerceptronTagger
+from collections import Counter
+import functools
+from typing import Dict, Any, List, Tuple
 import re
+from text_utils import _preview
 
-# Download required NLTK data
+# spaCy's C-backed tagger is used when it and its small English model are installed
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab')
+    import spacy
+    _NLP = spacy.load("en_core_web_sm", disable=["parser", "ner", "lemmatizer"])
+except (ImportError, OSError):
+    _NLP = None
 
+# Download required NLTK data
 try:
     nltk.data.find('corpora/stopwords')
 except LookupError:
@@ -33,6 +30,50 @@ try:
 except LookupError:
     nltk.download('averaged_perceptron_tagger_eng')
 
+_KEEP_POS = ('NN', 'JJ')  # nouns and adjectives
+_WORD_RE = re.compile(r"[^\W\d_]{3,}")  # alphabetic runs of at least three letters
+
+# The stopword corpus and tagger model are loaded once per process, on first
+# use, so missing NLTK data only fails keyword extraction
+@functools.lru_cache(maxsize=1)
+def _get_stopwords() -> frozenset:
+    """Return the English stopword set, loading the corpus on first use."""
+    return frozenset(stopwords.words('english'))
+
+@functools.lru_cache(maxsize=1)
+def _get_tagger() -> PerceptronTagger:
+    """Return the shared NLTK tagger, loading its model on first use."""
+    return PerceptronTagger()
+
+def warmup() -> None:
+    """Load the NLTK stopwords and tagger up front; the spaCy model loads at import."""
+    if _NLP is None:
+        _get_stopwords()
+        _get_tagger()
+
+
+def _tag_tokens(text: str) -> List[Tuple[str, str]]:
+    """
+    Tokenize and POS-tag text, keeping only candidate keyword tokens.
+    
+    Args:
+        text: The text to tokenize
+        
+    Returns:
+        List of (lowercased token, Penn Treebank tag) pairs
+    """
+    if _NLP is not None:
+        return [
+            (token.lower_, token.tag_) for token in _NLP(text)
+            if len(token) > 2 and token.is_alpha and not token.is_stop
+        ]
+    
+    # Only alphabetic words of three or more letters are candidates, so a regex
+    # scan replaces Punkt tokenization and the separate cleanup passes
+    stop_words = _get_stopwords()
+    tokens = [token for token in _WORD_RE.findall(text.lower()) if token not in stop_words]
+    return _get_tagger().tag(tokens)
+
 def extract_keywords(text: str, num_keywords: int = 10) -> Dict[str, Any]:
     """
     Extract keywords from the given text using frequency analysis and POS tagging.
@@ -45,68 +86,39 @@ def extract_keywords(text: str, num_keywords: int = 10) -> Dict[str, Any]:
         Dict containing keywords with their frequencies and metadata
     """
     if not text or not text.strip():
-        return {
-            "error": "Text cannot be empty",
-            "content": [{"text": json.dumps({"error": "Text cannot be empty"})}],
-            "_meta": {"tool": "keyword_extraction", "error": "ValueError"},
-            "isError": True
-        }
+        raise ValueError("Text cannot be empty")
     
-    try:
-        # Tokenize and clean text
-        tokens = word_tokenize(text.lower())
-        
-        # Remove punctuation and non-alphabetic tokens
-        tokens = [token for token in tokens if token.isalpha()]
-        
-        # Remove stopwords
-        stop_words = set(stopwords.words('english'))
-        tokens = [token for token in tokens if token not in stop_words]
-        
-        # Filter by minimum length
-        tokens = [token for token in tokens if len(token) > 2]
-        
-        if not tokens:
-            return {
-                "error": "No valid tokens found after processing",
-                "content": [{"text": json.dumps({"error": "No valid tokens found"})}],
-                "_meta": {"tool": "keyword_extraction", "error": "ValueError"},
-                "isError": True
+    # Tokenize, clean and POS-tag text
+    pos_tags = _tag_tokens(text)
+    
+    if not pos_tags:
+        raise ValueError("No valid tokens found after processing")
+    
+    # Filter for nouns and adjectives
+    relevant_tokens = [word for word, pos in pos_tags if pos[:2] in _KEEP_POS]
+    
+    # Calculate frequency distribution
+    freq_dist = Counter(relevant_tokens)
+    
+    # Get top keywords
+    top_keywords = freq_dist.most_common(num_keywords)
+    
+    # Calculate additional metrics
+    total_tokens = len(pos_tags)
+    unique_tokens = len({word for word, _ in pos_tags})
+    
+    return {
+        "text": _preview(text),
+        "keywords": [
+            {
+                "word": word,
+                "frequency": count,
+                "relative_frequency": count / total_tokens
             }
-        
-        # POS tagging to filter for nouns and adjectives
-        pos_tags = pos_tag(tokens)
-        relevant_tokens = [word for word, pos in pos_tags if pos.startswith('NN') or pos.startswith('JJ')]
-        
-        # Calculate frequency distribution
-        freq_dist = FreqDist(relevant_tokens)
-        
-        # Get top keywords
-        top_keywords = freq_dist.most_common(num_keywords)
-        
-        # Calculate additional metrics
-        total_tokens = len(tokens)
-        unique_tokens = len(set(tokens))
-        
-        return {
-            "text": text[:200] + "..." if len(text) > 200 else text,
-            "keywords": [
-                {
-                    "word": word,
-                    "frequency": count,
-                    "relative_frequency": count / total_tokens
-                }
-                for word, count in top_keywords
-            ],
-            "total_tokens": total_tokens,
-            "unique_tokens": unique_tokens,
-            "vocabulary_diversity": unique_tokens / total_tokens if total_tokens > 0 else 0,
-            "extracted_count": len(top_keywords)
-        }
-    except Exception as e:
-        return {
-            "error": str(e),
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "keyword_extraction", "error": type(e).__name__},
-            "isError": True
-        }
\ No newline at end of file
+            for word, count in top_keywords
+        ],
+        "total_tokens": total_tokens,
+        "unique_tokens": unique_tokens,
+        "vocabulary_diversity": unique_tokens / total_tokens if total_tokens > 0 else 0,
+        "extracted_count": len(top_keywords)
+    }
@@ -1,6 +1,243 @@
+import bisect
 import textstat
-from typing import Dict, Any
-import json
+from typing import Dict, Any, List, NamedTuple, Tuple
+import functools
+import re
+from text_utils import _analyze_batch, _preview
+
+# numba compiles the single-pass counter when installed
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Syllables are approximated as vowel groups, less a silent final "e" (but not
+# the syllabic consonant + "le" ending), plus one for each vowel-less word
+_VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+_SILENT_E = re.compile(r"[aeiouy][^\W\daeiouy]+(?<!l)e\b|[aeiouy]le\b")
+_NO_VOWEL_WORD = re.compile(r"\b[^\W\daeiouy]+\b")
+
+# Flesch Reading Ease reading levels; a score at a threshold gets the easier label
+_FLESCH_THRESHOLDS = [30, 50, 60, 70, 80, 90]
+_FLESCH_LABELS = ["Very Difficult", "Difficult", "Fairly Difficult", "Standard",
+                  "Fairly Easy", "Easy", "Very Easy"]
+
+def _fast_syllables(text: str) -> int:
+    """
+    Estimate the syllable count of text with a few C-level regex scans.
+    
+    Replaces textstat's per-word dictionary lookup with a vowel-group
+    approximation that is much cheaper on long texts.
+    """
+    lowered = text.lower()
+    return (
+        len(_VOWEL_GROUPS.findall(lowered))
+        - len(_SILENT_E.findall(lowered))
+        + len(_NO_VOWEL_WORD.findall(lowered))
+    )
+
+def _single_pass_counts(data) -> Tuple[int, int, int, int, int, int]:
+    """
+    Count the sentences, words, letters, characters, syllables and raw words
+    of ASCII text in a single pass.
+    
+    A character-level state machine that reproduces the textstat counts and
+    _fast_syllables exactly, so that once compiled it can replace their
+    separate full-text scans. data holds the text's ASCII codes, as bytes or
+    a contiguous uint8 array so numba compiles it to a native byte loop.
+    """
+    fragments = ignored = words = letters = chars = syllables = raw_words = 0
+    # Whitespace-delimited tokens, as split by textstat's word counts
+    in_token = token_has_word = False
+    # textstat's sentence fragments: a word character, then up to and
+    # including the next run of terminators
+    in_fragment = in_terminators = fragment_token_has_word = False
+    fragment_words = 0
+    # Word-character runs, for the syllable rules (prev_class: 0 none or
+    # digit, 1 vowel, 2 consonant)
+    in_run = run_has_vowel_or_digit = prev_vowel = silent_e = False
+    consonants_after_vowel = False
+    consonants = last_consonant = prev_class = 0
+    
+    for c in data:
+        if 65 <= c <= 90:
+            c += 32
+        is_space = c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+        is_word = 97 <= c <= 122 or 48 <= c <= 57 or c == 95
+        is_terminator = c == 46 or c == 33 or c == 63
+        
+        if is_space:
+            in_token = False
+        else:
+            chars += 1
+            if not in_token:
+                in_token = True
+                token_has_word = False
+                raw_words += 1
+            if is_word:
+                letters += 1
+                if not token_has_word:
+                    token_has_word = True
+                    words += 1
+        
+        if in_fragment and in_terminators and not is_terminator:
+            fragments += 1
+            if fragment_words <= 2:
+                ignored += 1
+            in_fragment = False
+        if is_word and not in_fragment:
+            in_fragment = True
+            in_terminators = fragment_token_has_word = False
+            fragment_words = 0
+        if in_fragment:
+            if is_terminator:
+                in_terminators = True
+            elif is_space:
+                fragment_token_has_word = False
+            elif is_word and not fragment_token_has_word:
+                fragment_token_has_word = True
+                fragment_words += 1
+        
+        if is_word:
+            in_run = True
+            is_vowel = c == 97 or c == 101 or c == 105 or c == 111 or c == 117 or c == 121
+            if is_vowel:
+                if not prev_vowel:
+                    syllables += 1
+                run_has_vowel_or_digit = True
+                silent_e = (c == 101 and consonants > 0 and consonants_after_vowel
+                            and (last_consonant != 108 or consonants == 1))
+                consonants = 0
+                prev_class = 1
+            elif c <= 57:
+                run_has_vowel_or_digit = True
+                silent_e = False
+                consonants = prev_class = 0
+            else:
+                if prev_class == 2:
+                    consonants += 1
+                else:
+                    consonants = 1
+                    consonants_after_vowel = prev_class == 1
+                last_consonant = c
+                silent_e = False
+                prev_class = 2
+            prev_vowel = is_vowel
+        elif in_run:
+            if not run_has_vowel_or_digit:
+                syllables += 1
+            if silent_e:
+                syllables -= 1
+            in_run = run_has_vowel_or_digit = prev_vowel = silent_e = False
+            consonants = prev_class = 0
+    
+    if in_fragment:
+        fragments += 1
+        if fragment_words <= 2:
+            ignored += 1
+    if in_run:
+        if not run_has_vowel_or_digit:
+            syllables += 1
+        if silent_e:
+            syllables -= 1
+    
+    sentences = max(1, fragments - ignored) if len(data) > 0 else 0
+    return sentences, words, letters, chars, syllables, raw_words
+
+_compiled_counts = njit(cache=True)(_single_pass_counts) if njit is not None else None
+
+def _readability_scores(sentences: int, words: int, letters: int, chars: int,
+                        syllables: int, raw_words: int) -> Dict[str, float]:
+    """
+    Compute the readability formulas from precomputed text counts.
+    
+    Mirrors textstat's English formulas, including returning 0.0 when a formula's
+    inputs are zero. raw_words also counts punctuation-only words, which
+    textstat's ARI uses because their characters are included in chars.
+    """
+    words_per_sentence = words / sentences if sentences else 0.0
+    syllables_per_word = syllables / words if words else 0.0
+    letters_per_100_words = letters / words * 100 if words else 0.0
+    sentences_per_100_words = sentences / words * 100 if words else 0.0
+    chars_per_word = chars / raw_words if raw_words else 0.0
+    
+    if words_per_sentence == 0 or syllables_per_word == 0:
+        flesch_reading_ease = flesch_kincaid_grade = 0.0
+    else:
+        flesch_reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        flesch_kincaid_grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    
+    if letters_per_100_words == 0 or sentences_per_100_words == 0:
+        coleman_liau_index = 0.0
+    else:
+        coleman_liau_index = 0.058 * letters_per_100_words - 0.296 * sentences_per_100_words - 15.8
+    
+    if chars_per_word == 0 or words_per_sentence == 0:
+        automated_readability_index = 0.0
+    else:
+        automated_readability_index = 4.71 * chars_per_word + 0.5 * words_per_sentence - 21.43
+    
+    return {
+        "flesch_reading_ease": flesch_reading_ease,
+        "flesch_kincaid_grade": flesch_kincaid_grade,
+        "coleman_liau_index": coleman_liau_index,
+        "automated_readability_index": automated_readability_index
+    }
+
+class _ReadabilityResult(NamedTuple):
+    """Immutable text counts and readability scores for one text."""
+    sentence_count: int
+    word_count: int
+    char_count: int
+    syllable_count: int
+    flesch_reading_ease: float
+    flesch_kincaid_grade: float
+    coleman_liau_index: float
+    automated_readability_index: float
+
+# Longer texts are computed directly so a few large inputs cannot pin the cache's memory
+_MAX_CACHED_TEXT_LENGTH = 10_000
+
+@functools.lru_cache(maxsize=2048)
+def _compute_readability(text: str) -> _ReadabilityResult:
+    """Compute the text counts and readability scores, memoized per text."""
+    # Basic text statistics, each computed once; in a single compiled pass
+    # over the text's bytes where possible (non-ASCII text keeps the textstat
+    # path, whose Unicode character classes the byte loop does not model)
+    if _compiled_counts is not None and text.isascii():
+        (sentence_count, word_count, letter_count, char_count,
+         syllable_count, raw_word_count) = _compiled_counts(
+            np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        )
+    else:
+        sentence_count = textstat.sentence_count(text)
+        word_count = textstat.lexicon_count(text)
+        letter_count = textstat.letter_count(text)
+        char_count = textstat.char_count(text)
+        syllable_count = _fast_syllables(text)
+        raw_word_count = textstat.lexicon_count(text, removepunct=False)
+    
+    # Derive the readability formulas from the counts above
+    return _ReadabilityResult(
+        sentence_count, word_count, char_count, syllable_count,
+        **_readability_scores(
+            sentence_count, word_count, letter_count, char_count, syllable_count, raw_word_count
+        )
+    )
+
+def _readability(text: str) -> _ReadabilityResult:
+    """Compute readability for text, reusing cached results for repeated inputs."""
+    if len(text) > _MAX_CACHED_TEXT_LENGTH:
+        return _compute_readability.__wrapped__(text)
+    return _compute_readability(text)
+
+def warmup() -> None:
+    """
+    Run the readability counters once, compiling or loading the numba counter
+    when it is installed, without adding an entry to the result cache.
+    """
+    _compute_readability.__wrapped__("Warm up the readability counters.")
 
 def analyze_readability(text: str) -> Dict[str, Any]:
     """
@@ -13,64 +250,45 @@ def analyze_readability(text: str) -> Dict[str, Any]:
         Dict containing readability scores and metrics
     """
     if not text or not text.strip():
-        return {
-            "error": "Text cannot be empty",
-            "content": [{"text": json.dumps({"error": "Text cannot be empty"})}],
-            "_meta": {"tool": "readability_analysis", "error": "ValueError"},
-            "isError": True
+        raise ValueError("Text cannot be empty")
+    
+    # Cached results are immutable, so a fresh result dict is built per call
+    result = _readability(text)
+    sentence_count = result.sentence_count
+    word_count = result.word_count
+    syllable_count = result.syllable_count
+    flesch_score = result.flesch_reading_ease
+    
+    # Interpret Flesch Reading Ease score
+    reading_level = _FLESCH_LABELS[bisect.bisect_right(_FLESCH_THRESHOLDS, flesch_score)]
+    
+    return {
+        "text": _preview(text),
+        "readability_scores": {
+            "flesch_reading_ease": flesch_score,
+            "flesch_kincaid_grade": result.flesch_kincaid_grade,
+            "coleman_liau_index": result.coleman_liau_index,
+            "automated_readability_index": result.automated_readability_index
+        },
+        "reading_level": reading_level,
+        "text_statistics": {
+            "sentence_count": sentence_count,
+            "word_count": word_count,
+            "character_count": result.char_count,
+            "syllable_count": syllable_count,
+            "avg_words_per_sentence": word_count / sentence_count if sentence_count > 0 else 0,
+            "avg_syllables_per_word": syllable_count / word_count if word_count > 0 else 0
         }
+    }
+
+def analyze_readability_batch(texts: List[str]) -> Dict[str, Any]:
+    """
+    Analyze the readability of several texts in one call.
     
-    try:
-        # Calculate various readability metrics
-        flesch_score = textstat.flesch_reading_ease(text)
-        flesch_kincaid_grade = textstat.flesch_kincaid_grade(text)
-        coleman_liau_index = textstat.coleman_liau_index(text)
-        automated_readability_index = textstat.automated_readability_index(text)
-        
-        # Basic text statistics
-        sentence_count = textstat.sentence_count(text)
-        word_count = textstat.lexicon_count(text)
-        char_count = textstat.char_count(text)
-        syllable_count = textstat.syllable_count(text)
-        
-        # Interpret Flesch Reading Ease score
-        if flesch_score >= 90:
-            reading_level = "Very Easy"
-        elif flesch_score >= 80:
-            reading_level = "Easy"
-        elif flesch_score >= 70:
-            reading_level = "Fairly Easy"
-        elif flesch_score >= 60:
-            reading_level = "Standard"
-        elif flesch_score >= 50:
-            reading_level = "Fairly Difficult"
-        elif flesch_score >= 30:
-            reading_level = "Difficult"
-        else:
-            reading_level = "Very Difficult"
+    Args:
+        texts: The texts to analyze
         
-        return {
-            "text": text[:200] + "..." if len(text) > 200 else text,
-            "readability_scores": {
-                "flesch_reading_ease": flesch_score,
-                "flesch_kincaid_grade": flesch_kincaid_grade,
-                "coleman_liau_index": coleman_liau_index,
-                "automated_readability_index": automated_readability_index
-            },
-            "reading_level": reading_level,
-            "text_statistics": {
-                "sentence_count": sentence_count,
-                "word_count": word_count,
-                "character_count": char_count,
-                "syllable_count": syllable_count,
-                "avg_words_per_sentence": word_count / sentence_count if sentence_count > 0 else 0,
-                "avg_syllables_per_word": syllable_count / word_count if word_count > 0 else 0
-            }
-        }
-    except Exception as e:
-        return {
-            "error": str(e),
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "readability_analysis", "error": type(e).__name__},
-            "isError": True
-        }
\ No newline at end of file
+    Returns:
+        Dict containing one readability result per text, in input order
+    """
+    return _analyze_batch(analyze_readability, texts)
\ No newline at end of file
@@ -1,7 +1,8 @@
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
-from typing import Dict, Any
-import json
+from typing import Dict, Any, List, Tuple
+import functools
+from text_utils import _analyze_batch, _preview
 
 # Download required NLTK data
 try:
@@ -9,6 +10,31 @@ try:
 except LookupError:
     nltk.download('vader_lexicon')
 
+@functools.lru_cache(maxsize=1)
+def _get_analyzer() -> SentimentIntensityAnalyzer:
+    """Return the shared VADER analyzer, loading its lexicon on first use."""
+    return SentimentIntensityAnalyzer()
+
+def warmup() -> None:
+    """Load the VADER analyzer up front."""
+    _get_analyzer()
+
+# Longer texts are scored directly so a few large inputs cannot pin the cache's memory
+_MAX_CACHED_TEXT_LENGTH = 10_000
+
+@functools.lru_cache(maxsize=4096)
+def _cached_polarity(text: str) -> Tuple[float, float, float, float]:
+    """Return VADER (pos, neg, neu, compound) scores, memoized per text."""
+    scores = _get_analyzer().polarity_scores(text)
+    return scores['pos'], scores['neg'], scores['neu'], scores['compound']
+
+def _polarity_scores(text: str) -> Dict[str, float]:
+    """Score text with VADER, reusing cached results for repeated inputs."""
+    if len(text) > _MAX_CACHED_TEXT_LENGTH:
+        return _get_analyzer().polarity_scores(text)
+    pos, neg, neu, compound = _cached_polarity(text)
+    return {'pos': pos, 'neg': neg, 'neu': neu, 'compound': compound}
+
 def analyze_sentiment(text: str) -> Dict[str, Any]:
     """
     Analyze the sentiment of the given text using NLTK's VADER sentiment analyzer.
@@ -20,40 +46,41 @@ def analyze_sentiment(text: str) -> Dict[str, Any]:
         Dict containing sentiment scores and overall classification
     """
     if not text or not text.strip():
-        return {
-            "error": "Text cannot be empty",
-            "content": [{"text": json.dumps({"error": "Text cannot be empty"})}],
-            "_meta": {"tool": "sentiment_analysis", "error": "ValueError"},
-            "isError": True
-        }
+        raise ValueError("Text cannot be empty")
     
-    try:
-        analyzer = SentimentIntensityAnalyzer()
-        scores = analyzer.polarity_scores(text)
-        
-        # Determine overall sentiment
-        if scores['compound'] >= 0.05:
-            overall_sentiment = "positive"
-        elif scores['compound'] <= -0.05:
-            overall_sentiment = "negative"
-        else:
-            overall_sentiment = "neutral"
+    scores = _polarity_scores(text)
+    
+    # Determine overall sentiment
+    if scores['compound'] >= 0.05:
+        overall_sentiment = "positive"
+    elif scores['compound'] <= -0.05:
+        overall_sentiment = "negative"
+    else:
+        overall_sentiment = "neutral"
+    
+    return {
+        "text": _preview(text, 100),
+        "sentiment_scores": {
+            "positive": scores['pos'],
+            "negative": scores['neg'],
+            "neutral": scores['neu'],
+            "compound": scores['compound']
+        },
+        "overall_sentiment": overall_sentiment,
+        "confidence": abs(scores['compound'])
+    }
+
+def analyze_sentiment_batch(texts: List[str]) -> Dict[str, Any]:
+    """
+    Analyze the sentiment of several texts in one call.
+    
+    All texts share the loaded VADER analyzer and score cache, so a batch
+    avoids per-request tool dispatch overhead.
+    
+    Args:
+        texts: The texts to analyze
         
-        return {
-            "text": text[:100] + "..." if len(text) > 100 else text,
-            "sentiment_scores": {
-                "positive": scores['pos'],
-                "negative": scores['neg'],
-                "neutral": scores['neu'],
-                "compound": scores['compound']
-            },
-            "overall_sentiment": overall_sentiment,
-            "confidence": abs(scores['compound'])
-        }
-    except Exception as e:
-        return {
-            "error": str(e),
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "sentiment_analysis", "error": type(e).__name__},
-            "isError": True
-        }
\ No newline at end of file
+    Returns:
+        Dict containing one sentiment result per text, in input order
+    """
+    return _analyze_batch(analyze_sentiment, texts)
\ No newline at end of file
@@ -0,0 +1,30 @@
+import json
+from typing import Any, Dict
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+def _error_payload(tool_name: str, exc: Exception) -> Dict[str, Any]:
+    """
+    Build the MCP error response for an exception raised by a tool.
+    
+    Capabilities raise instead of returning error dicts, so this is the only
+    place an error is serialized.
+    
+    Args:
+        tool_name: Name of the tool that failed
+        exc: The exception raised by the tool
+        
+    Returns:
+        Dict in the MCP tool error format
+    """
+    return {
+        "content": [{"text": _dumps({"error": str(exc)})}],
+        "_meta": {"tool": tool_name, "error": type(exc).__name__},
+        "isError": True
+    }
@@ -1,11 +1,26 @@
-import json
-from typing import Any, Dict, Optional
+import sys
+from typing import Any, Dict, List, Optional
 from capabilities import sentiment_analysis, keyword_extraction, readability_analysis
 
 class UnknownToolError(Exception):
     """Raised when an unsupported tool_name is requested."""
     pass
 
+def _warmup() -> None:
+    """
+    Load each capability's lazily initialized resources before the first request.
+    
+    A capability that fails to warm up is reported on stderr and left for its
+    tool's first request to fail, without affecting the others.
+    """
+    for capability in (sentiment_analysis, keyword_extraction, readability_analysis):
+        try:
+            capability.warmup()
+        except Exception as e:
+            print(f"Warmup of {capability.__name__} failed: {type(e).__name__}: {e}", file=sys.stderr)
+
+_warmup()
+
 async def analyze_sentiment_handler(text: str) -> Dict[str, Any]:
     """
     Handler for sentiment analysis tool.
@@ -16,14 +31,20 @@ async def analyze_sentiment_handler(text: str) -> Dict[str, Any]:
     Returns:
         Dict containing sentiment analysis results
     """
-    try:
-        return sentiment_analysis.analyze_sentiment(text)
-    except Exception as e:
-        return {
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "analyze_sentiment", "error": type(e).__name__},
-            "isError": True
-        }
+    return sentiment_analysis.analyze_sentiment(text)
+
+
+async def analyze_sentiment_batch_handler(texts: List[str]) -> Dict[str, Any]:
+    """
+    Handler for batch sentiment analysis tool.
+    
+    Args:
+        texts: The texts to analyze
+        
+    Returns:
+        Dict containing one sentiment analysis result per text
+    """
+    return sentiment_analysis.analyze_sentiment_batch(texts)
 
 
 async def extract_keywords_handler(text: str, num_keywords: int = 10) -> Dict[str, Any]:
@@ -37,14 +58,7 @@ async def extract_keywords_handler(text: str, num_keywords: int = 10) -> Dict[st
     Returns:
         Dict containing keyword extraction results
     """
-    try:
-        return keyword_extraction.extract_keywords(text, num_keywords)
-    except Exception as e:
-        return {
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "extract_keywords", "error": type(e).__name__},
-            "isError": True
-        }
+    return keyword_extraction.extract_keywords(text, num_keywords)
 
 async def analyze_readability_handler(text: str) -> Dict[str, Any]:
     """
@@ -56,11 +70,16 @@ async def analyze_readability_handler(text: str) -> Dict[str, Any]:
     Returns:
         Dict containing readability analysis results
     """
-    try:
-        return readability_analysis.analyze_readability(text)
-    except Exception as e:
-        return {
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "analyze_readability", "error": type(e).__name__},
-            "isError": True
-        }
\ No newline at end of file
+    return readability_analysis.analyze_readability(text)
+
+async def analyze_readability_batch_handler(texts: List[str]) -> Dict[str, Any]:
+    """
+    Handler for batch readability analysis tool.
+    
+    Args:
+        texts: The texts to analyze
+        
+    Returns:
+        Dict containing one readability analysis result per text
+    """
+    return readability_analysis.analyze_readability_batch(texts)
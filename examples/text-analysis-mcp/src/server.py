@@ -1,6 +1,6 @@
 import os
 import sys
-import json
+from typing import List
 from fastmcp import FastMCP
 from dotenv import load_dotenv
 
@@ -12,6 +12,7 @@ load_dotenv()
 
 # Import our text analysis handlers
 import mcp_handlers
+from errors import _dumps, _error_payload
 
 # Initialize FastMCP server
 mcp = FastMCP("TextAnalysisMCP")
@@ -26,11 +27,19 @@ async def analyze_sentiment_tool(text: str) -> dict:
     try:
         return await mcp_handlers.analyze_sentiment_handler(text)
     except Exception as e:
-        return {
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "analyze_sentiment", "error": type(e).__name__},
-            "isError": True
-        }
+        return _error_payload("analyze_sentiment", e)
+
+
+@mcp.tool(
+    name="analyze_sentiment_batch",
+    description="Analyze the sentiment of a list of texts in one call using NLTK's VADER sentiment analyzer. Returns one sentiment result per text, in input order."
+)
+async def analyze_sentiment_batch_tool(texts: List[str]) -> dict:
+    """Analyze sentiment of each of the given texts."""
+    try:
+        return await mcp_handlers.analyze_sentiment_batch_handler(texts)
+    except Exception as e:
+        return _error_payload("analyze_sentiment_batch", e)
 
 
 # ─── KEYWORD EXTRACTION TOOL ─────────────────────────────────────────────────────────
@@ -43,11 +52,7 @@ async def extract_keywords_tool(text: str, num_keywords: int = 10) -> dict:
     try:
         return await mcp_handlers.extract_keywords_handler(text, num_keywords)
     except Exception as e:
-        return {
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "extract_keywords", "error": type(e).__name__},
-            "isError": True
-        }
+        return _error_payload("extract_keywords", e)
 
 # ─── READABILITY ANALYSIS TOOL ─────────────────────────────────────────────────────────
 @mcp.tool(
@@ -59,11 +64,18 @@ async def analyze_readability_tool(text: str) -> dict:
     try:
         return await mcp_handlers.analyze_readability_handler(text)
     except Exception as e:
-        return {
-            "content": [{"text": json.dumps({"error": str(e)})}],
-            "_meta": {"tool": "analyze_readability", "error": type(e).__name__},
-            "isError": True
-        }
+        return _error_payload("analyze_readability", e)
+
+@mcp.tool(
+    name="analyze_readability_batch",
+    description="Analyze the readability of a list of texts in one call. Returns one readability result per text, in input order."
+)
+async def analyze_readability_batch_tool(texts: List[str]) -> dict:
+    """Analyze readability of each of the given texts."""
+    try:
+        return await mcp_handlers.analyze_readability_batch_handler(texts)
+    except Exception as e:
+        return _error_payload("analyze_readability_batch", e)
 
 def main():
     """
@@ -75,12 +87,12 @@ def main():
         if transport == "sse":
             host = os.getenv("MCP_SSE_HOST", "0.0.0.0")
             port = int(os.getenv("MCP_SSE_PORT", "8000"))
-            print(json.dumps({"message": f"Starting SSE on {host}:{port}"}), file=sys.stderr)
+            print(_dumps({"message": f"Starting SSE on {host}:{port}"}), file=sys.stderr)
             mcp.run(transport="sse", host=host, port=port)
         else:
             mcp.run(transport="stdio")
     except Exception as e:
-        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        print(_dumps({"error": str(e)}), file=sys.stderr)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+from typing import Any, Callable, Dict, List
+
+def _preview(text: str, n: int = 200) -> str:
+    """
+    Truncate text for echoing back in a tool result.
+    
+    Args:
+        text: The analyzed text
+        n: Maximum number of characters to keep
+        
+    Returns:
+        The text unchanged if it fits, otherwise its first n characters plus "..."
+    """
+    return text if len(text) <= n else text[:n] + "..."
+
+def _analyze_batch(analyze: Callable[[str], Dict[str, Any]], texts: List[str]) -> Dict[str, Any]:
+    """
+    Apply a single-text analysis to each text of a batch.
+    
+    A text the analysis rejects is reported as an error in its own slot
+    rather than failing the whole batch.
+    
+    Args:
+        analyze: The single-text analysis function
+        texts: The texts to analyze
+        
+    Returns:
+        Dict containing one result per text, in input order
+    """
+    results = []
+    for text in texts:
+        try:
+            results.append(analyze(text))
+        except ValueError as e:
+            results.append({"error": str(e)})
+    return {
+        "results": results,
+        "count": len(results)
+    }
@@ -0,0 +1,52 @@
+"""Tests for readability analysis capabilities."""
+import pytest
+import textstat
+from capabilities import readability_analysis
+
+SAMPLES = [
+    "The cat sat on the mat. It was a sunny day!",
+    "Is this the table? Make the cake, then rhyme the whole line...",
+    "Rhythm & blues: isn't it grand? We'll see; they've said it's fine.",
+    "Dr. Smith arrived at 3.45 p.m. on the 2nd of May, 2024.",
+    "snake_case_name and __init__ appear in code_e listings.",
+    "   ...leading punctuation!!! Then words. Hi. Ok?  ",
+    "Tabs\tand\nnewlines\x0bvertical\x0cfeeds\x1cand separators\x1fend.",
+    "'Quoted' words, -- dashes -- and (parentheses) [brackets] {braces}.",
+    "A. B. C. Short ones. Two words. Three words here.",
+    "brr shh psst hmm tsk nth",
+    "Whole wholesale able table fable while style eye bye.",
+    "?!.",
+    "x",
+]
+
+
+def _reference_counts(text):
+    return (
+        textstat.sentence_count(text),
+        textstat.lexicon_count(text),
+        textstat.letter_count(text),
+        textstat.char_count(text),
+        readability_analysis._fast_syllables(text),
+        textstat.lexicon_count(text, removepunct=False),
+    )
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_single_pass_counts_match_textstat(text):
+    """Test the single-pass counter matches the textstat and regex path."""
+    counts = readability_analysis._single_pass_counts(text.encode("ascii"))
+    
+    assert counts == _reference_counts(text)
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_compiled_counts_match_textstat(text):
+    """Test the numba-compiled counter matches the textstat and regex path."""
+    np = pytest.importorskip("numpy")
+    if readability_analysis._compiled_counts is None:
+        pytest.skip("numba is not installed")
+    
+    data = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    counts = readability_analysis._compiled_counts(data)
+    
+    assert tuple(counts) == _reference_counts(text)
@@ -62,7 +62,7 @@ async def list_loaded_modules() -> Dict[str, Any]:
     for line in lines:
         line = line.strip()
         # Skip empty lines and headers
-        if line and not line.startswith('Currently Loaded') and not line.startswith('No modules'):
+        if line and not line.startswith(('Currently Loaded', 'No modules')):
             modules.append(line)
     
     return {
@@ -269,7 +269,7 @@ async def spider_search(pattern: Optional[str] = None) -> Dict[str, Any]:
     
     for line in lines:
         line = line.strip()
-        if line and not line.startswith('The following') and not line.startswith('To find'):
+        if line and not line.startswith(('The following', 'To find')):
             # Extract module name and versions
             if ':' in line:
                 name, versions = line.split(':', 1)
@@ -339,7 +339,7 @@ async def list_saved_collections() -> Dict[str, Any]:
     for line in lines:
         line = line.strip()
         # Skip headers and empty lines
-        if line and not line.startswith('Named collection') and not line.startswith('No named'):
+        if line and not line.startswith(('Named collection', 'No named')):
             # Extract collection name (usually follows a pattern like "1) name")
             match = re.search(r'\d+\)\s*(.+)', line)
             if match:
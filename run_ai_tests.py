@@ -17,6 +17,22 @@ def main():
         default='ai_agent_tests.yaml',
         help='Path to YAML test file (default: ai_agent_tests.yaml)'
     )
+    parser.add_argument(
+        '--parallelism',
+        type=int,
+        default=None,
+        help='Maximum number of tests to run concurrently (default: one per test, capped at 4x the CPU count)'
+    )
+    parser.add_argument(
+        '--persistent-agent',
+        action='store_true',
+        help='Reuse one AI agent process for all tests instead of spawning one per test'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the AI agent instead of reusing cached responses'
+    )
     
     args = parser.parse_args()
     
@@ -27,16 +43,20 @@ def main():
     
     try:
         # Initialize test loader
-        loader = AIAgentTestLoader(args.yaml)
-        
-        print(f"Running tests from: {args.yaml}")
-        print(f"Found {len(loader.tests)} test(s)")
-        
-        # Run all tests
-        results = loader.run_all_tests()
-        
-        # Print results
-        all_passed = loader.print_results(results)
+        with AIAgentTestLoader(
+            args.yaml,
+            parallelism=args.parallelism,
+            persistent_agent=args.persistent_agent,
+            cache=not args.no_cache
+        ) as loader:
+            print(f"Running tests from: {args.yaml}")
+            print(f"Found {len(loader.tests)} test(s)")
+            
+            # Run all tests
+            results = loader.run_all_tests()
+            
+            # Print results
+            all_passed = loader.print_results(results)
         
         # Exit with appropriate code
         sys.exit(0 if all_passed else 1)
@@ -19,7 +19,7 @@ fi
 
 # Install required packages if needed
 echo "Installing required packages..."
-pip install -q pyyaml jsonschema
+pip install -q pyyaml fastjsonschema orjson
 
 # Run the tests
 echo "Running AI agent prompt tests..."